@@ -9,68 +9,246 @@ Or run from within Blender's scripting tab.
 """
 
 import bpy
+import glob
+import math
+import numpy as np
 import os
+import sys
+import zipfile
+from contextlib import contextmanager
 from pathlib import Path
 
+# Blender doesn't put the script's directory on sys.path
+sys.path.insert(0, str(Path(__file__).parent))
+from cycles_devices import enable_cycles_gpu
+
 # Configuration
 IMAGE_FILENAME = "mandelbrot2d.png"
-SUBDIVISION_LEVEL = 8  # Higher = more detail (6-10 recommended, 10 = very high poly)
+SUBDIVISION_LEVEL = None  # None = match image resolution (10 for images 1024 px or larger), or 4-10 (higher = more detail, 10 = very high poly)
 DISPLACEMENT_STRENGTH = 2.0  # Height multiplier
 PLANE_SIZE = 10.0  # Size of the base plane
-
-def clear_scene():
-    """Remove all default objects from the scene"""
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete(use_global=False)
-
-    # Clear orphaned data
-    for mesh in bpy.data.meshes:
-        bpy.data.meshes.remove(mesh)
-    for material in bpy.data.materials:
-        bpy.data.materials.remove(material)
+VERTEX_CACHE_SIZE = 16  # GPU post-transform cache entries the face order targets
+
+def clear_scene(keep_objects=()):
+    """Remove all objects from the scene except those named in keep_objects"""
+    # Remove datablocks directly rather than via select_all/delete operators,
+    # which each poll the context and push an undo step
+    for obj in list(bpy.data.objects):
+        if obj.name not in keep_objects:
+            bpy.data.objects.remove(obj, do_unlink=True)
+
+    # Clear orphaned data (kept objects still use their mesh and material)
+    for mesh in list(bpy.data.meshes):
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+    for material in list(bpy.data.materials):
+        if material.users == 0:
+            bpy.data.materials.remove(material)
+
+def image_as_np(image):
+    """Return image pixels as an (H, W, 4) float32 array, bottom row first"""
+    width, height = image.size
+    pixels = np.empty(width * height * 4, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    return pixels.reshape(height, width, 4)
+
+def decode_image(filepath):
+    """Decode the image to an (H, W, 3) uint8 RGB array, top row first"""
+    try:
+        from PIL import Image as PILImage
+        with PILImage.open(filepath) as img:
+            return np.asarray(img.convert('RGB'), dtype=np.uint8)
+    except ImportError:
+        # Pillow isn't bundled with Blender; decode through Blender instead and
+        # drop the image datablock right away so no float RGBA copy lingers
+        image = bpy.data.images.load(filepath)
+        rgb = image_as_np(image)[::-1, :, :3]
+        bpy.data.images.remove(image)
+        return np.clip(np.rint(rgb * 255.0), 0, 255).astype(np.uint8)
 
 def load_image(filepath):
-    """Load image file into Blender"""
+    """Load the image as uint8 (H, W) luminance and (H, W, 3) RGB arrays, top row first"""
+    if not os.path.exists(filepath):
+        print(f"Error: Image file not found: {filepath}")
+        return None, None
+
+    colors = decode_image(filepath)
+
+    # ITU-R 601 luma, the same weights as Pillow's convert('L')
+    luma = colors @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+    heights = np.clip(np.rint(luma), 0, 255).astype(np.uint8)
+
+    print(f"Loaded image: {colors.shape[1]}x{colors.shape[0]} pixels")
+    return heights, colors
+
+def optimize_grid_order(faces, segments, cache_size=VERTEX_CACHE_SIZE):
+    """Reorder grid faces and vertices for locality, returning (vertex_order, faces)"""
+    # Vertical bands narrow enough that each row reuses the previous row's
+    # vertices while they're still in a FIFO cache of cache_size entries
+    band_width = max(1, cache_size // 2 - 1)
+    rows, cols = np.divmod(np.arange(len(faces)), segments)
+    faces = faces[np.lexsort((cols, rows, cols // band_width))]
+
+    # Renumber vertices in first-use order; vertex_order lists the old indices
+    _, first_use = np.unique(faces, return_index=True)
+    vertex_order = np.argsort(first_use, kind='stable')
+    remap = np.empty_like(vertex_order)
+    remap[vertex_order] = np.arange(len(vertex_order))
+    return vertex_order, remap[faces].astype(np.int32)
+
+def make_grid(n, size):
+    """Return (vertices, quads) of a flat n x n grid spanning size, centered at the origin"""
+    # Vertex (row j, column i) has index j * (n + 1) + i and sits at (xs[i], xs[j])
+    xs = np.linspace(-size / 2, size / 2, n + 1, dtype=np.float32)
+    x, y = np.meshgrid(xs, xs)
+    vertices = np.stack([x, y, np.zeros_like(x)], axis=-1).reshape(-1, 3)
+
+    # Counter-clockwise quads so normals face +Z
+    idx = np.arange((n + 1) * (n + 1), dtype=np.int32).reshape(n + 1, n + 1)
+    quads = np.stack([idx[:-1, :-1], idx[:-1, 1:], idx[1:, 1:], idx[1:, :-1]], axis=-1).reshape(-1, 4)
+    return vertices, quads
+
+def sample_grid(heights, colors, segments):
+    """Sample the image's nearest texels at the vertices of a segments x segments grid"""
+    height, width = heights.shape
+    count = segments + 1
+
+    # Heightmap rows run top-down while grid rows (y) run bottom-up; the
+    # samples come out in make_grid vertex order, heights normalized to 0-1
+    cols = np.rint(np.linspace(0, width - 1, count)).astype(np.intp)
+    rows = np.rint(np.linspace(height - 1, 0, count)).astype(np.intp)
+    vertex_heights = (heights[np.ix_(rows, cols)] * np.float32(1.0 / 255.0)).ravel()
+    vertex_colors = colors[np.ix_(rows, cols)].reshape(-1, 3)
+    return vertex_heights, vertex_colors
+
+def write_atomic(path, save_fn, *args, **kwargs):
+    """Write a cache file via save_fn(file, ...) to a temp name, then move it into place"""
+    # A crash mid-write leaves only the temp file, never a truncated cache
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            save_fn(f, *args, **kwargs)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+def grid_cache_prefix(filepath):
+    """Common prefix of all grid sidecars for the current version (mtime) of filepath"""
+    mtime = os.stat(filepath).st_mtime_ns
+    return f"{filepath}.{mtime:x}."
+
+def grid_cache_path(filepath, subdivision_level):
+    """Sidecar path for the grid samples of filepath, keyed by its mtime and the level setting"""
+    level = "auto" if subdivision_level is None else subdivision_level
+    return f"{grid_cache_prefix(filepath)}{level}.grid.npz"
+
+def load_grid_samples(filepath, subdivision_level):
+    """Return (segments, vertex_heights, vertex_colors) for the heightmap grid, or None"""
     if not os.path.exists(filepath):
         print(f"Error: Image file not found: {filepath}")
         return None
 
-    # Load or reuse existing image
-    image_name = os.path.basename(filepath)
-    if image_name in bpy.data.images:
-        image = bpy.data.images[image_name]
-    else:
-        image = bpy.data.images.load(filepath)
-
-    print(f"Loaded image: {image.size[0]}x{image.size[1]} pixels")
-    return image
-
-def create_heightmap_mesh(image, subdivision_level, displacement_strength, plane_size):
-    """Create a subdivided plane with displacement from image"""
-
-    # Create plane
-    bpy.ops.mesh.primitive_plane_add(size=plane_size, location=(0, 0, 0))
-    plane = bpy.context.active_object
-    plane.name = "Mandelbrot_Heightmap"
-
-    # Add subdivision surface modifier for smoothness (optional, comment out for sharp pixels)
-    subsurf = plane.modifiers.new(name="Subdivision", type='SUBSURF')
-    subsurf.levels = 2
-    subsurf.render_levels = 3
-
-    # Subdivide the plane for displacement detail
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.select_all(action='SELECT')
-    for _ in range(subdivision_level):
-        bpy.ops.mesh.subdivide()
-    bpy.ops.object.mode_set(mode='OBJECT')
-
-    print(f"Created plane with {len(plane.data.vertices)} vertices")
-
-    # Create material with displacement
+    # Re-runs on an unchanged image skip decoding and resampling altogether
+    cache_path = grid_cache_path(filepath, subdivision_level)
+    if os.path.exists(cache_path):
+        try:
+            with np.load(cache_path) as cache:
+                samples = int(cache['segments']), cache['heights'], cache['colors']
+            print(f"Loaded grid samples from {os.path.basename(cache_path)}")
+            return samples
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            print(f"Ignoring unreadable cache {os.path.basename(cache_path)}")
+
+    heights, colors = load_image(filepath)
+
+    # Roughly one vertex per texel: finer grids add no height detail
+    if subdivision_level is None:
+        subdivision_level = max(4, min(10, int(math.log2(min(heights.shape)))))
+        print(f"Derived subdivision level {subdivision_level} from image size")
+    segments = 2 ** subdivision_level
+    vertex_heights, vertex_colors = sample_grid(heights, colors, segments)
+
+    # Drop sidecars of older versions of the image before writing the new one;
+    # those for the current version at other levels stay valid. <image>.npy
+    # is the full decode cache of earlier versions of this script
+    current_prefix = grid_cache_prefix(filepath)
+    stale_paths = [path for path in glob.glob(glob.escape(filepath) + ".*.grid.npz")
+                   if not path.startswith(current_prefix)]
+    if os.path.exists(filepath + ".npy"):
+        stale_paths.append(filepath + ".npy")
+    for stale_path in stale_paths:
+        os.remove(stale_path)
+    write_atomic(cache_path, np.savez, segments=segments, heights=vertex_heights, colors=vertex_colors)
+    return segments, vertex_heights, vertex_colors
+
+def grid_arrays(vertex_heights, vertex_colors, segments, plane_size, strength):
+    """Return the (coords, triangles, per-vertex uvs, colors) arrays of the heightmap grid"""
+    count = segments + 1
+    coords, faces = make_grid(segments, plane_size)
+    coords[:, 2] = vertex_heights * strength
+
+    uv_grid = np.linspace(0.0, 1.0, count, dtype=np.float32)
+    u, v = np.meshgrid(uv_grid, uv_grid)
+    vert_uvs = np.stack([u, v], axis=-1).reshape(-1, 2)
+
+    # Split quads up front so renderers don't re-triangulate them
+    vertex_order, faces = optimize_grid_order(faces, segments)
+    triangles = faces[:, [0, 1, 2, 0, 2, 3]].reshape(-1, 3)
+    return coords[vertex_order], triangles, vert_uvs[vertex_order], vertex_colors[vertex_order]
+
+def set_vertex_colors(mesh, vert_colors):
+    """Write per-vertex uint8 sRGB colors into the mesh's 'Col' attribute"""
+    rgba = np.ones((len(vert_colors), 4), dtype=np.float32)
+    rgba[:, :3] = vert_colors * (1.0 / 255.0)
+    mesh.color_attributes['Col'].data.foreach_set('color_srgb', rgba.ravel())
+
+def build_grid_mesh(vertex_heights, vertex_colors, segments, plane_size, strength):
+    """Build a displaced, vertex-colored grid mesh straight from the grid samples"""
+    coords, faces, vert_uvs, vert_colors = grid_arrays(vertex_heights, vertex_colors, segments, plane_size, strength)
+    face_count = len(faces)
+
+    mesh = bpy.data.meshes.new("Mandelbrot_Heightmap")
+    mesh.vertices.add(len(coords))
+    mesh.vertices.foreach_set('co', coords.ravel())
+    mesh.loops.add(faces.size)
+    mesh.loops.foreach_set('vertex_index', faces.ravel())
+    mesh.polygons.add(face_count)
+    mesh.polygons.foreach_set('loop_start', np.arange(0, faces.size, 3, dtype=np.int32))
+    if not bpy.types.MeshPolygon.bl_rna.properties['loop_total'].is_readonly:
+        # Blender < 4.0 needs explicit loop counts
+        mesh.polygons.foreach_set('loop_total', np.full(face_count, 3, dtype=np.int32))
+
+    uv_layer = mesh.uv_layers.new(name="UVMap")
+    uv_layer.data.foreach_set('uv', vert_uvs[faces.ravel()].ravel())
+
+    mesh.color_attributes.new(name="Col", type='BYTE_COLOR', domain='POINT')
+    set_vertex_colors(mesh, vert_colors)
+
+    mesh.update(calc_edges=True)
+    return mesh
+
+def update_grid_mesh(mesh, vertex_heights, vertex_colors, segments, plane_size, strength):
+    """Rewrite the positions and colors of a mesh made by build_grid_mesh in place"""
+    coords, _, _, vert_colors = grid_arrays(vertex_heights, vertex_colors, segments, plane_size, strength)
+    mesh.vertices.foreach_set('co', coords.ravel())
+    set_vertex_colors(mesh, vert_colors)
+    mesh.update()
+
+def get_or_create(collection, name, creator_fn):
+    """Return the datablock called name from collection, creating it if missing"""
+    existing = collection.get(name)
+    return existing if existing is not None else creator_fn()
+
+def reads_color_attribute(material):
+    """Whether material takes its color from the mesh's 'Col' attribute"""
+    return material.node_tree is not None and any(
+        node.type == 'ATTRIBUTE' and node.attribute_name == "Col" for node in material.node_tree.nodes)
+
+def create_heightmap_material():
+    """Create the material shading the heightmap from its 'Col' attribute"""
     material = bpy.data.materials.new(name="Mandelbrot_Material")
     material.use_nodes = True
-    plane.data.materials.append(material)
 
     # Get node tree
     nodes = material.node_tree.nodes
@@ -88,29 +266,60 @@ def create_heightmap_mesh(image, subdivision_level, displacement_strength, plane
     node_bsdf.inputs['Metallic'].default_value = 0.3
     node_bsdf.inputs['Roughness'].default_value = 0.4
 
-    node_image = nodes.new(type='ShaderNodeTexImage')
-    node_image.location = (-400, 0)
-    node_image.image = image
+    node_color = nodes.new(type='ShaderNodeAttribute')
+    node_color.location = (-400, 0)
+    node_color.attribute_name = "Col"
 
     node_colorramp = nodes.new(type='ShaderNodeValToRGB')
     node_colorramp.location = (-200, -300)
 
-    # Connect nodes - use image color for material color
-    links.new(node_image.outputs['Color'], node_bsdf.inputs['Base Color'])
+    # Connect nodes - use the baked image colors for material color
+    links.new(node_color.outputs['Color'], node_bsdf.inputs['Base Color'])
     links.new(node_bsdf.outputs['BSDF'], node_output.inputs['Surface'])
 
-    # Add displacement modifier
-    displace = plane.modifiers.new(name="Displace", type='DISPLACE')
-    displace.strength = displacement_strength
-    displace.mid_level = 0.0  # Black = no displacement
+    return material
 
-    # Create texture for displacement
-    texture = bpy.data.textures.new(name="Mandelbrot_Displacement", type='IMAGE')
-    texture.image = image
-    displace.texture = texture
+def create_heightmap_mesh(vertex_heights, vertex_colors, segments, displacement_strength, plane_size):
+    """Create a grid mesh displaced and colored by the heightmap image samples"""
 
-    # Set texture coordinates to UV (plane has default UVs)
-    displace.texture_coords = 'UV'
+    # Displacement and color are written straight into the vertex data; a grid
+    # of the same size from a previous run only gets them rewritten
+    plane = bpy.data.objects.get("Mandelbrot_Heightmap")
+    if (plane is not None and len(plane.data.vertices) == (segments + 1) ** 2
+            and len(plane.data.polygons) == 2 * segments ** 2
+            and 'Col' in plane.data.color_attributes):
+        update_grid_mesh(plane.data, vertex_heights, vertex_colors, segments, plane_size, displacement_strength)
+        print(f"Updated plane with {len(plane.data.vertices)} vertices")
+    else:
+        if plane is not None:
+            old_mesh = plane.data
+            bpy.data.objects.remove(plane, do_unlink=True)
+            bpy.data.meshes.remove(old_mesh)
+
+        mesh = build_grid_mesh(vertex_heights, vertex_colors, segments, plane_size, displacement_strength)
+
+        plane = bpy.data.objects.new("Mandelbrot_Heightmap", mesh)
+        bpy.context.collection.objects.link(plane)
+
+        # Smooth shading instead of a SUBSURF modifier: the grid is already dense,
+        # so Catmull-Clark on top only multiplies faces (set False for sharp pixels)
+        mesh.polygons.foreach_set('use_smooth', [True] * len(mesh.polygons))
+        mesh.update()
+
+        print(f"Created plane with {len(plane.data.vertices)} vertices")
+
+    bpy.context.view_layer.objects.active = plane
+
+    # Scenes saved by older versions have a material sampling an image texture
+    # under the same name, which would ignore the vertex colors
+    material = bpy.data.materials.get("Mandelbrot_Material")
+    if material is not None and not reads_color_attribute(material):
+        bpy.data.materials.remove(material)
+    material = get_or_create(bpy.data.materials, "Mandelbrot_Material", create_heightmap_material)
+    if plane.data.materials:
+        plane.data.materials[0] = material
+    else:
+        plane.data.materials.append(material)
 
     return plane
 
@@ -134,55 +343,92 @@ def setup_camera(target_object):
     return camera
 
 def setup_lighting():
-    """Create three-point lighting setup"""
+    """Create a single key light; the world provides the fill (see setup_world)"""
 
-    # Key light (main light)
+    # Key light (main light). Every lamp adds a shadow ray per shading event,
+    # so fill and rim come from the cheaper uniform world lighting instead
     bpy.ops.object.light_add(type='SUN', location=(10, -10, 15))
     key_light = bpy.context.active_object
     key_light.name = "Key_Light"
-    key_light.data.energy = 3.0
+    key_light.data.energy = 4.0
     key_light.rotation_euler = (0.8, 0, 0.7)
 
-    # Fill light (softer, from opposite side)
-    bpy.ops.object.light_add(type='SUN', location=(-5, 5, 8))
-    fill_light = bpy.context.active_object
-    fill_light.name = "Fill_Light"
-    fill_light.data.energy = 1.5
-    fill_light.rotation_euler = (1.0, 0, -0.5)
-
-    # Rim light (from behind, creates outline)
-    bpy.ops.object.light_add(type='SUN', location=(-10, 10, 5))
-    rim_light = bpy.context.active_object
-    rim_light.name = "Rim_Light"
-    rim_light.data.energy = 2.0
-    rim_light.rotation_euler = (1.2, 0, -2.0)
-
 def setup_world():
     """Configure world settings for better rendering"""
     world = bpy.context.scene.world
     world.use_nodes = True
+    nodes = world.node_tree.nodes
+    links = world.node_tree.links
 
-    # Set background color
-    bg_node = world.node_tree.nodes['Background']
+    # Set background color (what the camera sees directly)
+    bg_node = nodes['Background']
     bg_node.inputs['Color'].default_value = (0.05, 0.05, 0.05, 1.0)  # Dark gray
     bg_node.inputs['Strength'].default_value = 0.3
 
+    # Warm ambient light for everything else, replacing the fill and rim lights
+    ambient_node = nodes.get('Ambient') or nodes.new(type='ShaderNodeBackground')
+    ambient_node.name = 'Ambient'
+    ambient_node.location = (bg_node.location.x, bg_node.location.y - 150)
+    ambient_node.inputs['Color'].default_value = (0.25, 0.22, 0.19, 1.0)
+    ambient_node.inputs['Strength'].default_value = 1.5
+
+    light_path = nodes.get('Light Path') or nodes.new(type='ShaderNodeLightPath')
+    light_path.location = (bg_node.location.x, bg_node.location.y + 300)
+    mix_node = nodes.get('Mix Shader') or nodes.new(type='ShaderNodeMixShader')
+    mix_node.location = (bg_node.location.x + 200, bg_node.location.y)
+
+    # Camera rays see the dark background, all other rays the ambient light
+    links.new(light_path.outputs['Is Camera Ray'], mix_node.inputs['Fac'])
+    links.new(ambient_node.outputs['Background'], mix_node.inputs[1])
+    links.new(bg_node.outputs['Background'], mix_node.inputs[2])
+    links.new(mix_node.outputs['Shader'], nodes['World Output'].inputs['Surface'])
+
 def configure_render_settings():
     """Set up render settings for better output"""
     scene = bpy.context.scene
 
-    # Use Cycles renderer for better quality (or EEVEE for faster preview)
-    scene.render.engine = 'CYCLES'
-    scene.cycles.samples = 128  # Increase for final render
-
-    # Or use EEVEE for real-time preview:
-    # scene.render.engine = 'BLENDER_EEVEE'
-    # scene.eevee.taa_render_samples = 64
+    # EEVEE for fast previews; set MANDELBRODIN_CYCLES=1 for a Cycles render
+    if os.environ.get('MANDELBRODIN_CYCLES'):
+        scene.render.engine = 'CYCLES'
+        scene.cycles.samples = 128  # Increase for final render
+
+        backend = enable_cycles_gpu()
+        if backend:
+            scene.cycles.device = 'GPU'
+            print(f"Cycles rendering on {backend} GPU")
+        else:
+            print("No Cycles GPU found, rendering on CPU")
+        scene.cycles.denoiser = 'OPTIX' if backend == 'OPTIX' else 'OPENIMAGEDENOISE'
+
+        # Stop sampling converged pixels early and keep BVH/scene data between renders
+        scene.cycles.use_adaptive_sampling = True
+        scene.cycles.adaptive_threshold = 0.01
+        scene.render.use_persistent_data = True
+
+        # Clamp indirect light to curb fireflies without extra samples
+        scene.cycles.sample_clamp_indirect = 3.0
+    else:
+        try:
+            scene.render.engine = 'BLENDER_EEVEE_NEXT'  # Blender 4.2 - 4.x
+        except TypeError:
+            scene.render.engine = 'BLENDER_EEVEE'
+        scene.eevee.taa_render_samples = 32
 
     scene.render.resolution_x = 1920
     scene.render.resolution_y = 1080
     scene.render.resolution_percentage = 100
 
+@contextmanager
+def global_undo_disabled():
+    """Turn off global undo for the duration of the block, restoring it afterwards"""
+    edit_prefs = bpy.context.preferences.edit
+    use_global_undo = edit_prefs.use_global_undo
+    edit_prefs.use_global_undo = False
+    try:
+        yield
+    finally:
+        edit_prefs.use_global_undo = use_global_undo
+
 def main():
     """Main execution function"""
     print("=" * 60)
@@ -193,57 +439,64 @@ def main():
     script_dir = Path(__file__).parent
     image_path = script_dir / IMAGE_FILENAME
 
-    # Clear existing scene
-    print("Clearing scene...")
-    clear_scene()
-
-    # Load image
-    print(f"Loading image: {image_path}")
-    image = load_image(str(image_path))
-    if not image:
-        return
-
-    # Create heightmap mesh
-    print("Creating heightmap mesh...")
-    plane = create_heightmap_mesh(
-        image,
-        SUBDIVISION_LEVEL,
-        DISPLACEMENT_STRENGTH,
-        PLANE_SIZE
-    )
-
-    # Setup camera
-    print("Setting up camera...")
-    camera = setup_camera(plane)
-
-    # Setup lighting
-    print("Setting up lighting...")
-    setup_lighting()
-
-    # Setup world
-    print("Configuring world...")
-    setup_world()
-
-    # Configure render settings
-    print("Configuring render settings...")
-    configure_render_settings()
-
-    # Save .blend file
-    blend_filepath = script_dir / "mandelbrot_3d_scene.blend"
-    print(f"Saving scene to: {blend_filepath}")
-    bpy.ops.wm.save_as_mainfile(filepath=str(blend_filepath))
+    # Nothing here needs undo; skip the per-operator undo snapshots
+    with global_undo_disabled():
+        # Clear existing scene, keeping the heightmap so a re-run can update it in place
+        print("Clearing scene...")
+        clear_scene(keep_objects=("Mandelbrot_Heightmap",))
+
+        # Load image samples at the grid vertices (2^level segments per side)
+        print(f"Loading image: {image_path}")
+        samples = load_grid_samples(str(image_path), SUBDIVISION_LEVEL)
+        if samples is None:
+            return
+        segments, vertex_heights, vertex_colors = samples
+        subdivision_level = segments.bit_length() - 1
+
+        # Create heightmap mesh
+        print("Creating heightmap mesh...")
+        plane = create_heightmap_mesh(
+            vertex_heights,
+            vertex_colors,
+            segments,
+            DISPLACEMENT_STRENGTH,
+            PLANE_SIZE
+        )
+
+        # Setup camera
+        print("Setting up camera...")
+        camera = setup_camera(plane)
+
+        # Setup lighting
+        print("Setting up lighting...")
+        setup_lighting()
+
+        # Setup world
+        print("Configuring world...")
+        setup_world()
+
+        # Configure render settings
+        print("Configuring render settings...")
+        configure_render_settings()
+
+        # Evaluate the finished scene once, then save the .blend file
+        bpy.context.view_layer.depsgraph.update()
+        blend_filepath = script_dir / "mandelbrot_3d_scene.blend"
+        print(f"Saving scene to: {blend_filepath}")
+        # Uncompressed: saving becomes bandwidth-bound instead of zlib-bound
+        bpy.ops.wm.save_as_mainfile(filepath=str(blend_filepath), compress=False, copy=False)
 
     print("=" * 60)
     print("Scene creation complete!")
     print("=" * 60)
-    print(f"Subdivision level: {SUBDIVISION_LEVEL}")
+    print(f"Subdivision level: {subdivision_level}")
     print(f"Displacement strength: {DISPLACEMENT_STRENGTH}")
     print(f"Plane size: {PLANE_SIZE}")
     print(f"Vertices: {len(plane.data.vertices)}")
     print(f"Saved to: {blend_filepath}")
     print("")
     print("Adjust settings at the top of the script:")
-    print("  - SUBDIVISION_LEVEL: Higher = more detail (6-10)")
+    print("  - SUBDIVISION_LEVEL: None = match image, or higher = more detail (4-10)")
     print("  - DISPLACEMENT_STRENGTH: Height multiplier")
     print("  - PLANE_SIZE: Base plane dimensions")
     print("")
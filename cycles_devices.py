@@ -0,0 +1,33 @@
+"""
+Cycles GPU device setup shared by the Blender scripts
+
+Cycles device preferences live in the user preferences, not in the .blend,
+so every Blender process rendering a GPU scene has to enable them itself.
+"""
+
+import bpy
+
+def enable_cycles_gpu():
+    """Enable all GPUs of the best available Cycles backend, returning it (or None)"""
+    prefs = bpy.context.preferences.addons['cycles'].preferences
+    for device_type in ('OPTIX', 'CUDA', 'HIP', 'METAL', 'ONEAPI'):
+        devices = prefs.get_devices_for_type(device_type)
+        gpus = [device for device in devices if device.type == device_type]
+        if gpus:
+            prefs.compute_device_type = device_type
+            for device in devices:
+                device.use = device in gpus
+            return device_type
+    return None
+
+def restore_cycles_gpu(scene):
+    """Re-enable the GPU devices for a loaded scene saved to render on the GPU"""
+    if scene.render.engine != 'CYCLES' or scene.cycles.device != 'GPU':
+        return None
+
+    backend = enable_cycles_gpu()
+    if backend:
+        print(f"Cycles rendering on {backend} GPU")
+    else:
+        print("No Cycles GPU found, rendering on CPU")
+    return backend
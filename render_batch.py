@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Render the 3D heightmap scene in parallel horizontal strips
+
+Each strip is rendered by its own background Blender process using a
+render border, then the strips are stitched into the final image with
+Pillow. Run this with a regular Python (not inside Blender).
+
+Usage:
+    python render_batch.py --gpus N [--workers N] [--blender PATH]
+
+The scene must be built for Cycles (MANDELBRODIN_CYCLES=1 when running
+create_3d_from_heightmap.py); EEVEE renders don't split across processes.
+Worker i is pinned to GPU i % N (one worker per GPU by default). There is
+no CPU mode: every process loads the scene and builds the full BVH, so
+splitting one machine's cores between processes is slower than a single
+Cycles render.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+# Configuration
+BLEND_FILENAME = "mandelbrot_3d_scene.blend"
+OUTPUT_FILENAME = "mandelbrot_3d_render.png"
+STRIP_OVERLAP = 32  # Extra rows rendered past each strip edge so the denoiser sees across it
+
+# Prints the scene's render engine and output height, one per line
+PROBE_SCRIPT = """
+import bpy
+render = bpy.context.scene.render
+print("RENDER_ENGINE=" + render.engine)
+print("RENDER_HEIGHT=" + str(render.resolution_y * render.resolution_percentage // 100))
+"""
+
+# Runs inside each Blender worker; border fractions are measured from the bottom
+STRIP_SCRIPT = """
+import sys
+import bpy
+
+sys.path.insert(0, {script_dir!r})
+from cycles_devices import restore_cycles_gpu
+
+scene = bpy.context.scene
+restore_cycles_gpu(scene)
+
+scene.render.use_border = True
+scene.render.use_crop_to_border = True
+scene.render.border_min_x = 0.0
+scene.render.border_max_x = 1.0
+scene.render.border_min_y = {min_y!r}
+scene.render.border_max_y = {max_y!r}
+scene.render.filepath = {output!r}
+scene.render.image_settings.file_format = 'PNG'
+scene.render.image_settings.color_mode = 'RGB'
+bpy.ops.render.render(write_still=True)
+"""
+
+def probe_scene(blender, blend_path):
+    """Return (render engine, output height in pixels) of the saved scene, None where unreadable"""
+    command = [blender, "--background", str(blend_path), "--python-expr", PROBE_SCRIPT]
+    result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    values = dict(line.split("=", 1) for line in result.stdout.splitlines()
+                  if line.startswith(("RENDER_ENGINE=", "RENDER_HEIGHT=")))
+    height = values.get("RENDER_HEIGHT")
+    return values.get("RENDER_ENGINE"), int(height) if height else None
+
+def strip_command(blender, blend_path, script_dir, first_row, end_row, height, output):
+    """Build the Blender command line rendering image rows [first_row, end_row), counted from the top"""
+    # Blender truncates border * height to whole pixels, so aim at pixel centers
+    min_y = (height - end_row + 0.5) / height
+    max_y = min(1.0, (height - first_row + 0.5) / height)
+    script = STRIP_SCRIPT.format(script_dir=str(script_dir), min_y=min_y, max_y=max_y,
+                                 output=str(output))
+    return [blender, "--background", str(blend_path), "--python-expr", script]
+
+def worker_env(worker_index, gpu_count):
+    """Environment for a worker, pinned to one GPU"""
+    env = dict(os.environ)
+    device = str(worker_index % gpu_count)
+    env["CUDA_VISIBLE_DEVICES"] = device
+    env["HIP_VISIBLE_DEVICES"] = device
+    return env
+
+def render_strips(blender, blend_path, script_dir, strip_dir, height, workers, gpu_count):
+    """Render all strips in parallel, returning (path, crop_top, rows) per strip, top to bottom"""
+    bounds = [round(i * height / workers) for i in range(workers + 1)]
+    strips = []
+    for i in range(workers):
+        # Render past the strip edges and crop back later, so each strip is
+        # denoised with its neighbours' pixels and no seams show
+        first_row = max(0, bounds[i] - STRIP_OVERLAP)
+        end_row = min(height, bounds[i + 1] + STRIP_OVERLAP)
+        strips.append((strip_dir / f"strip_{i:03d}.png", first_row, end_row,
+                       bounds[i] - first_row, bounds[i + 1] - bounds[i]))
+
+    def run(i):
+        output, first_row, end_row, _, _ = strips[i]
+        command = strip_command(blender, blend_path, script_dir, first_row, end_row, height, output)
+        result = subprocess.run(command, env=worker_env(i, gpu_count),
+                                stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        if result.returncode != 0 or not output.exists():
+            raise RuntimeError(f"Strip {i} failed:\n{result.stdout}")
+        print(f"Strip {i + 1}/{workers} done")
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(run, range(workers)))
+
+    return [(output, crop_top, rows) for output, _, _, crop_top, rows in strips]
+
+def assemble_strips(strips, output_path):
+    """Crop the overlap off each (path, crop_top, rows) strip and stack them top to bottom"""
+    images = [(Image.open(path), crop_top, rows) for path, crop_top, rows in strips]
+    width = images[0][0].width
+    height = sum(rows for _, _, rows in images)
+
+    result = Image.new("RGB", (width, height))
+    y = 0
+    for image, crop_top, rows in images:
+        result.paste(image.crop((0, crop_top, width, crop_top + rows)), (0, y))
+        y += rows
+        image.close()
+
+    result.save(output_path)
+    return width, height
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Render the heightmap scene in parallel strips")
+    parser.add_argument("--gpus", type=int, required=True,
+                        help="Number of GPUs to spread the workers over")
+    parser.add_argument("--workers", type=int,
+                        help="Number of Blender processes / strips (default: one per GPU)")
+    parser.add_argument("--blender", default="blender", help="Path to the Blender executable")
+    args = parser.parse_args()
+    if args.gpus < 1:
+        parser.error("--gpus must be at least 1")
+    if args.workers is None:
+        args.workers = args.gpus
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    script_dir = Path(__file__).resolve().parent
+    blend_path = script_dir / BLEND_FILENAME
+    output_path = script_dir / OUTPUT_FILENAME
+
+    if not blend_path.exists():
+        print(f"Error: Scene not found: {blend_path}")
+        print("Create it first with: blender --python create_3d_from_heightmap.py")
+        return 1
+
+    # Only Cycles parallelizes across processes; EEVEE workers would share one
+    # GPU, recompile shaders each and can leave seams at strip edges
+    engine, height = probe_scene(args.blender, blend_path)
+    if engine != 'CYCLES':
+        print(f"Error: {blend_path.name} renders with {engine or 'an unknown engine'}, "
+              "strip rendering needs Cycles")
+        print("Rebuild it with: MANDELBRODIN_CYCLES=1 blender --python create_3d_from_heightmap.py")
+        return 1
+    if not height:
+        print(f"Error: Could not read the render resolution of {blend_path.name}")
+        return 1
+    workers = min(args.workers, height)
+
+    print("=" * 60)
+    print(f"Rendering {blend_path.name} in {workers} strips on {args.gpus} GPU(s)...")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as strip_dir:
+        strips = render_strips(args.blender, blend_path, script_dir, Path(strip_dir),
+                               height, workers, args.gpus)
+        width, height = assemble_strips(strips, output_path)
+
+    print("=" * 60)
+    print(f"Render complete! {width}x{height} saved to: {output_path}")
+    print("=" * 60)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,14 +4,23 @@ Quick render script to generate a preview image of the 3D heightmap scene
 
 Usage:
     blender --background mandelbrot_3d_scene.blend --python render_preview.py
+
+Set PREVIEW_PCT to change the preview resolution percentage (default 50).
 """
 
 import bpy
+import os
+import sys
 from pathlib import Path
 
+# Blender doesn't put the script's directory on sys.path
+sys.path.insert(0, str(Path(__file__).parent))
+from cycles_devices import restore_cycles_gpu
+
 # Configuration
 OUTPUT_FILENAME = "mandelbrot_3d_preview.png"
-RENDER_SAMPLES = 64  # Lower for faster preview, higher (128-512) for quality
+RENDER_SAMPLES = 32  # Enough with adaptive sampling and denoising; lower for faster preview, higher (128-512) for quality
+PREVIEW_PERCENTAGE = int(os.environ.get('PREVIEW_PCT', '50'))  # Of the scene resolution
 
 def render_preview():
     """Render the current scene to an image file"""
@@ -24,19 +33,28 @@ def render_preview():
     # Set output path
     scene.render.filepath = str(output_path)
 
-    # Use EEVEE for faster rendering (or keep Cycles for quality)
-    if scene.render.engine == 'CYCLES':
+    # Keep whichever engine the scene was saved with
+    engine = scene.render.engine
+    if engine == 'CYCLES':
+        restore_cycles_gpu(scene)
         scene.cycles.samples = RENDER_SAMPLES
+        scene.cycles.use_adaptive_sampling = True
         print(f"Rendering with Cycles at {RENDER_SAMPLES} samples...")
+    elif engine.startswith('BLENDER_EEVEE'):
+        print(f"Rendering with EEVEE at {scene.eevee.taa_render_samples} samples...")
     else:
-        print("Rendering with EEVEE...")
+        print(f"Rendering with {engine}...")
+
+    # Render cost scales with pixel count, so trade resolution for latency
+    scene.render.resolution_percentage = PREVIEW_PERCENTAGE
 
     # Set output format
     scene.render.image_settings.file_format = 'PNG'
     scene.render.image_settings.color_mode = 'RGB'
+    scene.render.image_settings.compression = 15  # Fast PNG encode
 
     print(f"Output: {output_path}")
-    print(f"Resolution: {scene.render.resolution_x}x{scene.render.resolution_y}")
+    print(f"Resolution: {scene.render.resolution_x}x{scene.render.resolution_y} at {PREVIEW_PERCENTAGE}%")
     print("Starting render...")
 
     # Render